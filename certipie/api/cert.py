@@ -1,4 +1,3 @@
-import ipaddress
 import logging
 import tempfile
 from datetime import datetime
@@ -8,6 +7,7 @@ from typing import Literal, Optional, Union
 from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import APIRouter, BackgroundTasks, Depends, Form
 from fastapi.responses import FileResponse
+from typing_extensions import Annotated
 
 from ..core import create_auto_certificate, create_csr, create_private_key
 from ..types import PrivateKey
@@ -20,7 +20,15 @@ from .helpers import (
     get_pk_info,
     get_private_key,
 )
-from .schemas import DomainName, PrivateKeyInput, city_form, country_form, organization_form, state_or_province_form
+from .schemas import (
+    AlternativeNameType,
+    DomainName,
+    PrivateKeyInput,
+    city_form,
+    country_form,
+    organization_form,
+    state_or_province_form,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -34,7 +42,8 @@ def get_rsa_private_key(background_tasks: BackgroundTasks, pk_info: PrivateKeyIn
     key_path = tmp_path / f'{pk_info.filename_prefix}.pem'
 
     # we create the zip with private and public keys
-    private_key = create_private_key(f'{key_path}', pk_info.key_size, str(pk_info.passphrase))
+    # inputs are already validated by FastAPI, so we call the undecorated core functions
+    private_key = create_private_key.raw_function(f'{key_path}', pk_info.key_size, pk_info.passphrase)
     public_key_path = create_public_key(tmp_path, private_key, pk_info)
     zip_path = tmp_path / f'{pk_info.filename_prefix}.zip'
     create_zipfile(zip_path, [key_path, public_key_path])
@@ -47,6 +56,15 @@ def get_rsa_private_key(background_tasks: BackgroundTasks, pk_info: PrivateKeyIn
 @router.post('/csr', responses={200: {'content': {'application/zip': {}}}})
 def get_csr(
     background_tasks: BackgroundTasks,
+    # FastAPI drops the DomainName validator when Form is given as default value, so we use Annotated here
+    # and declare the parameter first since it has no default
+    common_name: Annotated[
+        DomainName,
+        Form(
+            description='The common name of the csr i.e the main domain name you want to provide a certificate.',
+            examples=['site.com'],
+        ),
+    ],
     private_key: Optional[PrivateKey] = Depends(get_private_key),
     passphrase: bytes = Depends(get_passphrase),
     filename_prefix: str = Form(
@@ -55,24 +73,19 @@ def get_csr(
             'the prefix of the file created. For example if you pass "csr" you will receive a file "csr.pem". '
             'If not provided, defaults to "csr".'
         ),
-        example='csr',
+        examples=['csr'],
     ),
     country: str = country_form(...),
     state_or_province: str = state_or_province_form(...),
     city: str = city_form(...),
     organization: str = organization_form(...),
-    common_name: DomainName = Form(
-        ...,
-        description='The common name of the csr i.e the main domain name you want to provide a certificate.',
-        example='site.com',
-    ),
-    alternative_names: Optional[list[DomainName]] = Form(
+    alternative_names: list[DomainName] = Form(
         [],
         description=(
             'The list of domain names covered by the certificate. If not provided, defaults to'
             'the "common_name" value passed as input.'
         ),
-        example=['site.com', 'foo.site.com'],
+        examples=[['site.com', 'foo.site.com']],
     ),
 ):
     """
@@ -84,7 +97,7 @@ def get_csr(
     csr_path = tmp_path / f'{filename_prefix}.pem'
     zip_path = tmp_path / f'{filename_prefix}.zip'
 
-    create_csr(
+    create_csr.raw_function(
         f'{csr_path}',
         country,
         state_or_province,
@@ -102,16 +115,6 @@ def get_csr(
     return FileResponse(f'{zip_path}', media_type='application/zip')
 
 
-AlternativeNameType = Union[
-    DomainName,
-    ipaddress.IPv4Address,
-    ipaddress.IPv6Address,
-    ipaddress.IPv4Network,
-    ipaddress.IPv6Network,
-    Literal['localhost'],
-]
-
-
 @router.post('/auto-certificate', responses={200: {'content': {'application/zip': {}}}})
 def get_auto_certificate(
     background_tasks: BackgroundTasks,
@@ -123,7 +126,7 @@ def get_auto_certificate(
             'the prefix of the file created. For example if you pass "cert" you will receive a file "cert.pem".'
             ' If not provided, defaults to "cert".'
         ),
-        example='csr',
+        examples=['csr'],
     ),
     country: str = country_form(...),
     state_or_province: str = state_or_province_form(...),
@@ -136,15 +139,15 @@ def get_auto_certificate(
             'of an auto-certificate, "localhost" is a valid value and it is the default if this field is not'
             'provided.'
         ),
-        example='site.com',
+        examples=['site.com'],
     ),
-    alternative_names: Optional[list[AlternativeNameType]] = Form(
+    alternative_names: list[AlternativeNameType] = Form(
         ['localhost', '127.0.0.1', '::1'],
         description=(
             'The list of domain names, ipv4/v6 addresses or networks covered by the certificate. If not '
             'provided, defaults to "localhost", 127.0.0.1 and ::1.'
         ),
-        example=['192.168.1.1', 'local.com'],
+        examples=[['192.168.1.1', 'local.com']],
     ),
     date_end: datetime = Depends(get_date_end),
 ):
@@ -157,7 +160,7 @@ def get_auto_certificate(
     cert_path = tmp_path / f'{filename_prefix}.pem'
     zip_path = tmp_path / f'{filename_prefix}.zip'
 
-    create_auto_certificate(
+    create_auto_certificate.raw_function(
         f'{cert_path}',
         country,
         state_or_province,
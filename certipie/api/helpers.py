@@ -8,7 +8,6 @@ from typing import Optional
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from fastapi import Depends, File, Form
-from pydantic import SecretBytes
 
 from ..core import get_public_key_from_private_key
 from ..types import PrivateKey
@@ -19,16 +18,20 @@ def delete_tmp_dir(tmp_dir: str) -> None:
     shutil.rmtree(tmp_dir)
 
 
+# the default input is never mutated by the route, so there is no need to validate a new one on each request
+DEFAULT_PK_INFO = PrivateKeyInput()
+
+
 def get_pk_info(pk_info: Optional[PrivateKeyInput] = None) -> PrivateKeyInput:
-    return pk_info if pk_info is not None else PrivateKeyInput()
+    return pk_info if pk_info is not None else DEFAULT_PK_INFO
 
 
 def get_passphrase(
-    passphrase: Optional[SecretBytes] = Form(
-        b'', description='passphrase used to encrypt the private key. Can be optional.', example='secret passphrase'
+    passphrase: bytes = Form(
+        b'', description='passphrase used to encrypt the private key. Can be optional.', examples=['secret passphrase']
     ),
 ) -> bytes:
-    return passphrase if isinstance(passphrase, bytes) else passphrase.get_secret_value()
+    return passphrase
 
 
 def get_private_key(
@@ -47,19 +50,22 @@ def get_private_key(
 
 
 def get_date_end(
-    end_validity: int = Form(365, description='The number of days the certificate will be valid.', gt=0, example=365)
+    end_validity: int = Form(365, description='The number of days the certificate will be valid.', gt=0, examples=[365])
 ) -> datetime:
     return datetime.utcnow() + timedelta(days=end_validity)
 
 
 def create_public_key(tmp_path: Path, private_key: rsa.RSAPrivateKey, pk_info: PrivateKeyInput) -> Path:
     public_key_path = tmp_path / f'{pk_info.filename_prefix}.pub'
-    get_public_key_from_private_key(public_key_path, private_key)
+    get_public_key_from_private_key.raw_function(public_key_path, private_key)
 
     return public_key_path
 
 
+# the zip is written on disk and routes return it with a FileResponse which sends it by chunks,
+# so the archive is never held entirely in memory
 def create_zipfile(zip_path: Path, path_list: list[Path]) -> None:
-    with zipfile.ZipFile(f'{zip_path}', 'w', compression=zipfile.ZIP_DEFLATED) as my_zip:
+    # PEM files are small and base64 encoded, deflating them costs more CPU than the few bytes it saves
+    with zipfile.ZipFile(f'{zip_path}', 'w', compression=zipfile.ZIP_STORED) as my_zip:
         for path in path_list:
             my_zip.write(str(path), path.name)
@@ -1,25 +1,46 @@
+from contextlib import asynccontextmanager
 from logging import getLogger
-from typing import Union
+from typing import AsyncIterator, Union
 
 from cryptography.exceptions import UnsupportedAlgorithm
 from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware import Middleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .cert import router
 
 logger = getLogger(__name__)
 
 
-async def cert_exception(request: Request, exc: Union[TypeError, ValueError, UnsupportedAlgorithm]) -> JSONResponse:
+async def cert_exception(request: Request, exc: Union[TypeError, ValueError, UnsupportedAlgorithm]) -> ORJSONResponse:
     logger.error('operation on route %s %s failed', request.method, str(request.url))
     # TODO: understand why the relevant test blocks on pytest on the following line
     # logger.error('request form passed: %s', await request.form())
-    return JSONResponse(status_code=422, content={'detail': str(exc)})
+    return ORJSONResponse(status_code=422, content={'detail': str(exc)})
 
 
-exception_handlers = {TypeError: cert_exception, ValueError: cert_exception, UnsupportedAlgorithm: cert_exception}
+# same as the FastAPI default handler, but serialized with orjson
+async def validation_exception(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=422, content={'detail': jsonable_encoder(exc.errors())})
+
+
+exception_handlers = {
+    RequestValidationError: validation_exception,
+    TypeError: cert_exception,
+    ValueError: cert_exception,
+    UnsupportedAlgorithm: cert_exception,
+}
+
+
+@asynccontextmanager
+async def lifespan(fastapi_app: FastAPI) -> AsyncIterator[None]:
+    # FastAPI caches the OpenAPI schema after building it, so we build it before the first documentation request
+    fastapi_app.openapi()
+    yield
+
 
 app = FastAPI(
     title='certificate api',
@@ -27,7 +48,9 @@ app = FastAPI(
     description='Utilities to create certificate signing request and self-signed certificate for testing purpose',
     redoc_url=None,
     docs_url='/',
+    default_response_class=ORJSONResponse,
     middleware=[Middleware(GZipMiddleware, minimum_size=1000)],
     exception_handlers=exception_handlers,
+    lifespan=lifespan,
 )
 app.include_router(router, prefix='/certs', tags=['certificate'])
@@ -1,43 +1,76 @@
+import ipaddress
 from functools import partial
-from typing import Optional
+from typing import Any, Literal, Union
 
 from fastapi import Form
-from pydantic import BaseModel, Field, SecretBytes
+from pydantic import AfterValidator, BaseModel, Field, ValidatorFunctionWrapHandler, WrapValidator
+from typing_extensions import Annotated
 
 from certipie.core import is_domain_name
+from certipie.types import KeySize
 
 
 class PrivateKeyInput(BaseModel):
-    filename_prefix: Optional[str] = Field(
+    filename_prefix: str = Field(
         'id_rsa',
         description=(
             'The prefix if the files created. For example if you pass "id_rsa", you will have a zip with two files'
             '"id_rsa.pem" for the private key and "id_rsa.pub" for the public key.'
         ),
-        example='id_rsa',
+        json_schema_extra={'example': 'id_rsa'},
     )
-    key_size: Optional[int] = Field(
-        2048, description='Like te name said.. the key size for the private key.', ge=512, example=2048
+    key_size: KeySize = Field(
+        2048, description='Like te name said.. the key size for the private key.', json_schema_extra={'example': 2048}
     )
-    passphrase: Optional[SecretBytes] = Field(
-        b'', description='Passphrase used to encrypt the private_key, can be optional.', example='my passphrase'
+    # repr=False keeps the passphrase out of logs and tracebacks showing the model
+    passphrase: bytes = Field(
+        b'',
+        description='Passphrase used to encrypt the private_key, can be optional.',
+        repr=False,
+        json_schema_extra={'example': 'my passphrase'},
     )
 
 
-class DomainName(str):
-    @classmethod
-    def validate(cls, value):
-        if not is_domain_name(value):
-            raise ValueError('not a valid domain name')
+def _check_domain(value: str) -> str:
+    if not is_domain_name(value):
+        raise ValueError('not a valid domain name')
 
+    return value
+
+
+DomainName = Annotated[str, AfterValidator(_check_domain)]
+
+
+def _check_alternative_name(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    # "localhost" and ip addresses or networks are the most common values, we check them directly instead of trying
+    # each member of the union, the union is still used to report errors on invalid values
+    if value == 'localhost':
         return value
 
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    if isinstance(value, str) and (value[:1].isdigit() or ':' in value):
+        for ip_function in (ipaddress.ip_address, ipaddress.ip_network):
+            try:
+                ip_function(value)
+                return value
+            except ValueError:
+                pass
+
+    return handler(value)
+
 
+AlternativeNameType = Annotated[
+    Union[
+        DomainName,
+        ipaddress.IPv4Address,
+        ipaddress.IPv6Address,
+        ipaddress.IPv4Network,
+        ipaddress.IPv6Network,
+        Literal['localhost'],
+    ],
+    WrapValidator(_check_alternative_name),
+]
 
-country_form = partial(Form, description='Two letter code of your country', example='FR', min_length=2, max_length=2)
-state_or_province_form = partial(Form, description='the state or province information', example='Ile-de-France')
-city_form = partial(Form, description='the city information', example='Paris')
-organization_form = partial(Form, description='the organization information', example='Organization Inc.')
+country_form = partial(Form, description='Two letter code of your country', examples=['FR'], min_length=2, max_length=2)
+state_or_province_form = partial(Form, description='the state or province information', examples=['Ile-de-France'])
+city_form = partial(Form, description='the city information', examples=['Paris'])
+organization_form = partial(Form, description='the organization information', examples=['Organization Inc.'])
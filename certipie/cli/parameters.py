@@ -16,7 +16,8 @@ class IpModel(pydantic.BaseModel):
 class HostModel(pydantic.BaseModel):
     host: Union[Literal['localhost'], ipaddress.IPv6Address, ipaddress.IPv4Address]
 
-    @pydantic.validator('host', pre=True)
+    @pydantic.field_validator('host', mode='before')
+    @classmethod
     def lower_value(cls, value: str) -> str:
         return value.lower()
 
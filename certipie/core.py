@@ -1,9 +1,10 @@
+import functools
 import ipaddress
 import re
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import AnyStr, Protocol, Union, runtime_checkable
+from typing import AnyStr, Optional, Protocol, Union, runtime_checkable
 
 import idna
 from cryptography import x509
@@ -19,14 +20,14 @@ from cryptography.hazmat.primitives.serialization import (
 )
 from cryptography.x509 import Certificate, CertificateSigningRequest
 from cryptography.x509.oid import NameOID
-from pydantic import Field, FilePath, conint, constr, validate_arguments
+from pydantic import ConfigDict, Field, FilePath, constr, validate_call
 
 from . import types
 
 
-@validate_arguments
+@validate_call
 def create_private_key(
-    filename: constr(strict=True, min_length=1), key_size: conint(ge=512) = 2048, passphrase: AnyStr = b''
+    filename: constr(strict=True, min_length=1), key_size: types.KeySize = 2048, passphrase: bytes = b''
 ) -> rsa.RSAPrivateKey:
     """Creates an RSA private key given the filename, key size and optional passphrase."""
     key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
@@ -47,7 +48,7 @@ def create_private_key(
     return key
 
 
-@validate_arguments(config={'arbitrary_types_allowed': True})
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def get_public_key_from_private_key(file_path: Path, private_key: rsa.RSAPrivateKey) -> None:
     """Retrieves public key from private key file and saves it in a file."""
     with file_path.open('wb') as f:
@@ -70,10 +71,15 @@ def get_idn_domain_name(domain_name: str) -> str:
     return idna.encode(domain_name, uts46=True).decode('ascii')
 
 
+# the same domain names often come back, in the common name and the alternative names or from one request to another
+@functools.lru_cache(maxsize=4096)
 def is_domain_name(domain_name: str) -> bool:
     domain_name = domain_name[2:] if domain_name.startswith('*.') else domain_name
+    # idna encoding only lowers ascii characters, so we can reject an ascii name without paying the idna cost
+    if domain_name.isascii() and domain_pattern.fullmatch(domain_name) is None:
+        return False
     try:
-        return domain_pattern.match(get_idn_domain_name(domain_name)) is not None
+        return domain_pattern.fullmatch(get_idn_domain_name(domain_name)) is not None
     except idna.IDNAError:
         return False
 
@@ -111,7 +117,7 @@ def _get_private_key(
         return load_pem_private_key(private_key.read_bytes(), passphrase or None)
 
 
-@validate_arguments(config={'arbitrary_types_allowed': True})
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def create_csr(
     filename: constr(strict=True, min_length=1),
     country: constr(strict=True),
@@ -119,9 +125,9 @@ def create_csr(
     city: constr(strict=True),
     organization: constr(strict=True),
     common_name: constr(strict=True, max_length=255),
-    alternative_names: list[constr(strict=True, max_length=255)] = None,
-    private_key: Union[FilePath, PrivateKey] = None,
-    passphrase: AnyStr = b'',
+    alternative_names: Optional[list[constr(strict=True, max_length=255)]] = None,
+    private_key: Optional[Union[FilePath, PrivateKey]] = None,
+    passphrase: bytes = b'',
 ) -> CertificateSigningRequest:
     """Creates a certificate signing request and eventually an RSA private key if it is not given as input."""
     if not is_domain_name(common_name):
@@ -186,7 +192,7 @@ def _default_end_datetime() -> datetime:
     return datetime.utcnow() + timedelta(days=365)
 
 
-@validate_arguments(config={'arbitrary_types_allowed': True})
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def create_auto_certificate(
     filename: constr(strict=True, min_length=1),
     country: constr(strict=True),
@@ -194,9 +200,9 @@ def create_auto_certificate(
     city: constr(strict=True),
     organization: constr(strict=True),
     common_name: constr(strict=True, max_length=255) = 'localhost',
-    alternative_names: list[constr(strict=True)] = None,
-    private_key: Union[FilePath, PrivateKey] = None,
-    passphrase: AnyStr = b'',
+    alternative_names: Optional[list[constr(strict=True)]] = None,
+    private_key: Optional[Union[FilePath, PrivateKey]] = None,
+    passphrase: bytes = b'',
     end_validity: datetime = Field(default_factory=_default_end_datetime),
 ) -> Certificate:
     """Creates a self-signed certificate and eventually an RSA private key if it is not given as input."""
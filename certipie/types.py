@@ -1,7 +1,8 @@
 from typing import Union
 
 from cryptography.hazmat.primitives.asymmetric import dh, dsa, ec, ed448, ed25519, rsa, x448, x25519
-from typing_extensions import TypeAlias
+from pydantic import Field
+from typing_extensions import Annotated, TypeAlias
 
 PrivateKey: TypeAlias = Union[
     ed25519.Ed25519PrivateKey,
@@ -13,3 +14,6 @@ PrivateKey: TypeAlias = Union[
     x448.X448PrivateKey,
     dh.DHPrivateKey,
 ]
+
+# the constraint is checked by pydantic core, without calling any python validator
+KeySize: TypeAlias = Annotated[int, Field(ge=512)]
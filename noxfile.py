@@ -32,7 +32,7 @@ def tests(session):
     """Runs the test suite."""
     session.install('poetry>=1.0.0,<2.0.0')
     session.run('poetry', 'install')
-    session.run('pytest')
+    session.run('pytest', '-n', 'auto')
 
 
 @nox.session(python=False)
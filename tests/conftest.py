@@ -1,13 +1,47 @@
 import zipfile
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from click.testing import CliRunner
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi.testclient import TestClient
-from requests import Session
 
 from certipie.api import app
-from certipie.core import create_private_key
+from certipie.core import create_private_key, is_domain_name
+
+
+@pytest.fixture(scope='session')
+def rsa_keys() -> dict[tuple[int, int], rsa.RSAPrivateKey]:
+    """RSA keys generated during the test session, indexed by public exponent and key size."""
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def reuse_rsa_keys(request, monkeypatch, rsa_keys):
+    """
+    Generating an RSA key is by far the slowest part of the test suite and most tests don't care about a fresh key,
+    so we generate one key per key size for the whole session. Tests marked with "real_rsa_keygen" are not affected.
+    """
+    if request.node.get_closest_marker('real_rsa_keygen') is not None:
+        return
+
+    generate_private_key = rsa.generate_private_key
+
+    def _generate_private_key(public_exponent: int, key_size: int, backend=None) -> rsa.RSAPrivateKey:
+        if (public_exponent, key_size) not in rsa_keys:
+            rsa_keys[public_exponent, key_size] = generate_private_key(public_exponent, key_size)
+        return rsa_keys[public_exponent, key_size]
+
+    monkeypatch.setattr(rsa, 'generate_private_key', _generate_private_key)
+
+
+@pytest.fixture(autouse=True)
+def clear_domain_name_cache():
+    """Results of is_domain_name are cached, so we clear them to prevent a patched result from leaking to other tests."""
+    is_domain_name.cache_clear()
+    yield
+    is_domain_name.cache_clear()
 
 
 @pytest.fixture()
@@ -18,36 +52,28 @@ def private_key(tmp_path) -> Path:
     return key
 
 
-@pytest.fixture()
-def client() -> Session:
+@pytest.fixture(scope='session')
+def client() -> Iterator[TestClient]:
     """A test client for the REST API."""
-    return TestClient(app, base_url='http://testserver')
+    # the context manager keeps the same event loop thread and runs the lifespan only once for all the tests
+    with TestClient(app, base_url='http://testserver') as test_client:
+        yield test_client
 
 
 @pytest.fixture()
 def unzip_file():
     """Helper to unzip a zip file and returns a list of paths corresponding to the files inside the zip."""
-    to_delete: list[Path] = []
 
     def _unzip_file(content: bytes, tmp_path: Path) -> list[Path]:
-        nonlocal to_delete
-        paths = []
         filename = tmp_path / 'file.zip'
         with filename.open('wb') as archive:
             archive.write(content)
 
+        # we extract files in the temporary folder, so that tests running in parallel don't overwrite each other files
         with zipfile.ZipFile(filename) as my_zip:
-            for file in my_zip.namelist():
-                my_zip.extract(file)
-                paths.append(Path(file))
-            # don't forget to save a reference to the list to delete files after
-            to_delete = paths[:]
-            return paths
-
-    yield _unzip_file
+            return [Path(my_zip.extract(file, tmp_path)) for file in my_zip.namelist()]
 
-    for path in to_delete:
-        path.unlink()
+    return _unzip_file
 
 
 @pytest.fixture()
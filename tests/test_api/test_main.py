@@ -0,0 +1,14 @@
+from fastapi.testclient import TestClient
+
+from certipie.api import app
+
+
+def test_should_build_openapi_schema_on_startup(mocker):
+    mocker.patch.object(app, 'openapi_schema', None)
+
+    with TestClient(app) as client:
+        assert app.openapi_schema is not None
+        r = client.get('/openapi.json')
+
+        assert r.status_code == 200
+        assert r.json() == app.openapi_schema
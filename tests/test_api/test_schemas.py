@@ -1,7 +1,7 @@
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from certipie.api.schemas import DomainName
+from certipie.api.schemas import DomainName, PrivateKeyInput
 
 
 class MyDomain(BaseModel):
@@ -24,3 +24,20 @@ class TestDomainName:
     def test_should_not_raise_error_when_value_is_correct(self, value):
         d = MyDomain(domain=value)
         assert d.domain == value
+        # the validated value is a plain string, not an instance of a str subclass
+        assert type(d.domain) is str
+
+
+class TestPrivateKeyInput:
+    """Test PrivateKeyInput pydantic model"""
+
+    def test_should_not_show_passphrase_in_model_representation(self):
+        pk_info = PrivateKeyInput(passphrase='secret')
+
+        assert pk_info.passphrase == b'secret'
+        assert 'secret' not in repr(pk_info)
+
+    def test_should_default_passphrase_to_empty_bytes(self):
+        # the default value is not validated, so no wrapper object is created when the passphrase is omitted
+        assert type(PrivateKeyInput().passphrase) is bytes
+        assert PrivateKeyInput().passphrase == b''
@@ -12,7 +12,9 @@ from certipie.core import (
     create_auto_certificate,
     create_csr,
     create_private_key,
+    get_idn_domain_name,
     get_public_key_from_private_key,
+    is_domain_name,
     normalize_alternative_name,
 )
 
@@ -23,36 +25,45 @@ class TestCreatePrivateKey:
     @pytest.mark.parametrize('name', [b'foo', 4])
     def test_should_raise_error_when_filename_is_not_a_string(self, name):
         with pytest.raises(ValidationError) as exc_info:
-            create_private_key(name)  # type: ignore
+            create_private_key(filename=name)  # type: ignore
 
         message = str(exc_info.value)
-        assert 'type_error' in message
+        assert 'string_type' in message
         assert 'filename' in message
 
+    def test_should_report_argument_position_when_filename_is_given_positionally(self):
+        with pytest.raises(ValidationError) as exc_info:
+            create_private_key(b'foo')  # type: ignore
+
+        errors = exc_info.value.errors()
+        assert [error['type'] for error in errors] == ['string_type']
+        assert [error['loc'] for error in errors] == [(0,)]
+
     def test_should_raise_error_when_filename_length_is_less_than_1(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_private_key('')
+            create_private_key(filename='')
 
         message = str(exc_info.value)
         assert 'filename' in message
-        assert 'min_length' in message
+        assert 'string_too_short' in message
 
     def test_should_raise_error_when_key_size_is_not_an_integer(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_private_key('foo.pem', 'far')  # type: ignore
+            create_private_key('foo.pem', key_size='far')  # type: ignore
 
         message = str(exc_info.value)
         assert 'key_size' in message
-        assert 'type_error' in message
+        assert 'int_parsing' in message
 
     def test_should_raise_error_when_key_size_is_less_than_512(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_private_key('foo.pem', 30)
+            create_private_key('foo.pem', key_size=30)
 
         message = str(exc_info.value)
         assert 'key_size' in message
-        assert 'value_error' in message
+        assert 'greater_than_equal' in message
 
+    @pytest.mark.real_rsa_keygen
     @pytest.mark.parametrize('passphrase', [b'bla', 'bla', '', b''])
     def test_should_create_and_return_private_key_given_correct_input(self, tmp_path, passphrase):
         private_key = tmp_path / 'key.pem'
@@ -81,19 +92,41 @@ class TestCreateCsr:
     @pytest.mark.parametrize('name', [b'foo', 4])
     def test_should_raise_error_when_filename_is_not_a_string(self, name):
         with pytest.raises(ValidationError) as exc_info:
-            create_csr(name, 'FR', 'Ile-de-France', 'Paris', 'organization', 'site.com')  # type: ignore
+            create_csr(
+                filename=name,  # type: ignore
+                country='FR',
+                state_or_province='Ile-de-France',
+                city='Paris',
+                organization='organization',
+                common_name='site.com',
+            )
 
-        message = str(exc_info)
-        assert 'type_error' in message
+        message = str(exc_info.value)
+        assert 'string_type' in message
         assert 'filename' in message
 
+    def test_should_report_argument_position_when_filename_is_given_positionally(self):
+        with pytest.raises(ValidationError) as exc_info:
+            create_csr(4, 'FR', 'Ile-de-France', 'Paris', 'organization', 'site.com')  # type: ignore
+
+        errors = exc_info.value.errors()
+        assert [error['type'] for error in errors] == ['string_type']
+        assert [error['loc'] for error in errors] == [(0,)]
+
     def test_should_raise_error_when_filename_length_is_less_than_1(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_csr('', 'FR', 'Ile-de-France', 'Paris', 'organization', 'site.com')  # type: ignore
+            create_csr(
+                filename='',
+                country='FR',
+                state_or_province='Ile-de-France',
+                city='Paris',
+                organization='organization',
+                common_name='site.com',
+            )
 
         message = str(exc_info.value)
         assert 'filename' in message
-        assert 'min_length' in message
+        assert 'string_too_short' in message
 
     # common parameter checks
 
@@ -112,25 +145,25 @@ class TestCreateCsr:
 
         message = str(exc_info.value)
         assert list(argument.keys())[0] in message
-        assert 'type_error' in message
+        assert 'string_type' in message
 
     # common_name checks
 
     def test_should_raise_error_when_common_name_is_not_a_string(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_csr('csr.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', 4)  # type: ignore
+            create_csr('csr.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', common_name=4)  # type: ignore
 
         message = str(exc_info.value)
         assert 'common_name' in message
-        assert 'type_error' in message
+        assert 'string_type' in message
 
     def test_should_raise_error_when_common_name_length_is_greater_than_255(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_csr('csr.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', 'a' * 256)
+            create_csr('csr.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', common_name='a' * 256)
 
         message = str(exc_info.value)
         assert 'common_name' in message
-        assert 'max_length' in message
+        assert 'string_too_long' in message
 
     @pytest.mark.parametrize('domain_name', ['foo', 'foo.', 'foo.o'])
     def test_should_raise_value_error_when_common_name_is_not_a_valid_domain_name(self, domain_name):
@@ -143,11 +176,19 @@ class TestCreateCsr:
 
     def test_should_raise_value_error_when_alternative_name_length_is_more_than_255(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_csr('csr.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', 'site.com', ['foo.com', 'a' * 256])
+            create_csr(
+                'csr.pem',
+                'FR',
+                'Ile-de-France',
+                'Paris',
+                'organization',
+                'site.com',
+                alternative_names=['foo.com', 'a' * 256],
+            )
 
         message = str(exc_info.value)
         assert 'alternative_names' in message
-        assert 'max_length' in message
+        assert 'string_too_long' in message
 
     def test_should_raise_value_error_when_alternative_name_is_not_a_valid_domain_name_1(self):
         alternative_names = ['foo.com', 'foo', 'pie.io', 'foo.']  # 2nd and 4th are incorrect
@@ -183,7 +224,7 @@ class TestCreateCsr:
         message = str(exc_info.value)
 
         assert 'private_key' in message
-        assert 'value_error.path.not_exists' in message
+        assert 'path_not_file' in message
 
     def test_should_raise_error_when_file_cannot_be_decoded(self, tmp_path):
         key = tmp_path / 'key.pem'
@@ -268,6 +309,31 @@ class TestCreateCsr:
         assert csr_path.read_text().startswith('-----BEGIN CERTIFICATE REQUEST-----')
 
 
+class TestIsDomainName:
+    """Tests function is_domain_name"""
+
+    @pytest.mark.parametrize('value', ['foo', 'foo.', '-foo.com', 'foo.com\n', 'ドメイン'])
+    def test_should_return_false_when_value_is_not_a_domain_name(self, value):
+        assert is_domain_name(value) is False
+
+    def test_should_not_encode_ascii_value_not_matching_domain_pattern(self, mocker):
+        get_idn_mock = mocker.patch('certipie.core.get_idn_domain_name')
+
+        assert is_domain_name('foo') is False
+        get_idn_mock.assert_not_called()
+
+    @pytest.mark.parametrize('value', ['site.com', 'SITE.com', '*.site.com', 'ドメイン.テスト'])
+    def test_should_return_true_when_value_is_a_domain_name(self, value):
+        assert is_domain_name(value) is True
+
+    def test_should_cache_results(self, mocker):
+        get_idn_spy = mocker.patch('certipie.core.get_idn_domain_name', wraps=get_idn_domain_name)
+
+        assert is_domain_name('site.com') is True
+        assert is_domain_name('site.com') is True
+        get_idn_spy.assert_called_once_with('site.com')
+
+
 class TestNormalizeAlternativeName:
     """Tests function normalize_alternative_name"""
 
@@ -305,19 +371,33 @@ class TestCreateAutoCertificate:
     @pytest.mark.parametrize('name', [b'foo', 4])
     def test_should_raise_error_when_filename_is_not_a_string(self, name):
         with pytest.raises(ValidationError) as exc_info:
-            create_auto_certificate(name, 'FR', 'Ile-de-France', 'Paris', 'organization', 'site.com')  # type: ignore
+            create_auto_certificate(
+                filename=name,  # type: ignore
+                country='FR',
+                state_or_province='Ile-de-France',
+                city='Paris',
+                organization='organization',
+                common_name='site.com',
+            )
 
         message = str(exc_info.value)
         assert 'filename' in message
-        assert 'type_error' in message
+        assert 'string_type' in message
 
     def test_should_raise_error_when_filename_length_is_less_than_1(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_auto_certificate('', 'FR', 'Ile-de-France', 'Paris', 'organization', 'site.com')
+            create_auto_certificate(
+                filename='',
+                country='FR',
+                state_or_province='Ile-de-France',
+                city='Paris',
+                organization='organization',
+                common_name='site.com',
+            )
 
         message = str(exc_info.value)
         assert 'filename' in message
-        assert 'min_length' in message
+        assert 'string_too_short' in message
 
     # common parameter checks
 
@@ -337,25 +417,27 @@ class TestCreateAutoCertificate:
 
         message = str(exc_info.value)
         assert list(argument.keys())[0] in message
-        assert 'type_error' in message
+        assert 'string_type' in message
 
     # common_name checks
 
     def test_should_raise_error_when_common_name_is_not_a_string(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_auto_certificate('cert.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', 4)  # type: ignore
+            create_auto_certificate(
+                'cert.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', common_name=4  # type: ignore
+            )
 
         message = str(exc_info.value)
         assert 'common_name' in message
-        assert 'type_error' in message
+        assert 'string_type' in message
 
     def test_should_raise_error_when_common_name_length_is_greater_than_255(self):
         with pytest.raises(ValidationError) as exc_info:
-            create_auto_certificate('cert.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', 'a' * 256)
+            create_auto_certificate('cert.pem', 'FR', 'Ile-de-France', 'Paris', 'organization', common_name='a' * 256)
 
         message = str(exc_info.value)
         assert 'common_name' in message
-        assert 'max_length' in message
+        assert 'string_too_long' in message
 
     @pytest.mark.parametrize('domain_name', ['foo', 'foo.', 'foo.o'])
     def test_should_raise_value_error_when_common_name_is_not_a_valid_domain_name(self, domain_name):
@@ -391,7 +473,7 @@ class TestCreateAutoCertificate:
         message = str(exc_info.value)
 
         assert 'private_key' in message
-        assert 'value_error.path.not_exists' in message
+        assert 'path_not_file' in message
 
     def test_should_raise_error_when_file_cannot_be_decoded(self, tmp_path):
         key = tmp_path / 'key.pem'